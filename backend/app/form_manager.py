@@ -5,11 +5,14 @@ for interactive form filling where the AI asks for one field at a time.
 """
 
 import json
+import logging
 import os
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class FormField:
@@ -32,6 +35,8 @@ class FormSession:
     fields: List[FormField]
     current_field_index: int = 0
     completed_fields: Dict[str, Any] = None
+    # Rendered prompts keyed by field index; fields never change within a session
+    _prompt_cache: Dict[int, str] = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.completed_fields is None:
@@ -66,11 +71,17 @@ class FormSession:
     
     def get_next_field_prompt(self) -> Optional[str]:
         """Generate a natural language prompt for the next field."""
-        if self.current_field is None:
-            return None
-        
         field = self.current_field
+        if field is None:
+            return None
         
+        prompt = self._prompt_cache.get(self.current_field_index)
+        if prompt is None:
+            prompt = self._prompt_cache[self.current_field_index] = self._render_field_prompt(field)
+        return prompt
+    
+    def _render_field_prompt(self, field: FormField) -> str:
+        """Build the prompt text for a single field."""
         # Start with field description if available
         if field.description:
             prompt = f"Next, I need to know: {field.label}\n\n{field.description}"
@@ -143,10 +154,11 @@ class FormFieldManager:
         """Create a new form session for a user."""
         schema = self.load_form_schema(form_name)
         if not schema:
-            print(f"[DEBUG] Failed to load schema for form: {form_name}")
+            logger.warning("Failed to load schema for form: %s", form_name)
             return None
         
-        print(f"[DEBUG] Creating form session for user {user_id}, form {form_name}, schema loaded with {len(schema.get('fields', []))} fields")
+        logger.debug("Creating form session for user %s, form %s, schema loaded with %d fields",
+                     user_id, form_name, len(schema.get("fields", [])))
         
         fields = []
         for field_data in schema.get("fields", []):
@@ -303,6 +315,13 @@ class FormFieldManager:
             return True
         return False
 
+    def clear_all_sessions(self) -> int:
+        """Drop every active form session; returns how many were cleared."""
+        # Swap in a fresh dict rather than clearing in place, so anything still
+        # holding the old mapping is unaffected
+        sessions, self.active_sessions = self.active_sessions, {}
+        return len(sessions)
+
 
 # Global instance
 form_field_manager = FormFieldManager()
\ No newline at end of file
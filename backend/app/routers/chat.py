@@ -17,22 +17,39 @@ Deliberately minimal: no audio, no tool calls, no function execution.
 from __future__ import annotations
 
 import asyncio
-import json
+import io
 import logging
+import orjson
+import re
 import uuid
 import time
 import websockets
-from typing import Optional
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from fastapi import APIRouter, WebSocket, Depends
 from fastapi.responses import JSONResponse
 from ..config import get_settings, Settings
-from ..form_manager import form_field_manager
+from ..form_manager import FormField, FormSession, form_field_manager
 
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# Largest client frame we are willing to parse; chat turns are far smaller.
+MAX_WS_FRAME = 64 * 1024
+# Streamed deltas are coalesced for this long before being forwarded to the frontend
+DELTA_FLUSH_INTERVAL = 0.025
+# Frames buffered per frontend client, and how long one send may block, before the
+# client is treated as a stalled consumer and disconnected
+FRONTEND_QUEUE_SIZE = 256
+FRONTEND_SEND_TIMEOUT = 5.0
+# Requests queued while the AI is busy; beyond this the oldest are dropped.
+MAX_PENDING_REQUESTS = 256
+# Upper bound on tearing down a bridge when its client disconnects
+BRIDGE_CLOSE_TIMEOUT = 2.0
+
 system_prompt = """
 You are a government services assistant that helps users access official forms and fill them step by step.
 
@@ -167,17 +184,116 @@ CRITICAL:
 - Ask only one field at a time when in form filling mode
 """
 
+# Azure Realtime expects text frames, so serialized events are kept as str.
+# response.create never varies, so serialize it once instead of per turn.
+_RESPONSE_CREATE = orjson.dumps({
+    "type": "response.create",
+    "response": {
+        "modalities": ["text"],
+        "conversation": "auto",
+    },
+}).decode()
+
+
+# conversation.item.create split around the text, so only the text is encoded per call
+_ITEM_PREFIX = {
+    role: orjson.dumps({
+        "type": "conversation.item.create",
+        "item": {
+            "type": "message",
+            "role": role,
+            "content": [{"type": "input_text", "text": ""}],
+        },
+    }).decode()[:-len('""}]}}')]
+    for role in ("user", "system")
+}
+_ITEM_SUFFIX = "}]}}"
+
+
+def _conversation_item(role: str, text: str) -> str:
+    """Serialize a conversation.item.create event for the given role."""
+    return _ITEM_PREFIX[role] + orjson.dumps(text).decode() + _ITEM_SUFFIX
+
+
+# Sent on every (re)connect; both are constant, so encode them once
+_SESSION_UPDATE = orjson.dumps({
+    "type": "session.update",
+    "session": {
+        "modalities": ["text"],
+        "tool_choice": "none",
+    },
+}).decode()
+_SYSTEM_PROMPT_ITEM = _conversation_item("system", system_prompt)
+
+# permessage-deflate for the Azure leg with 4 KiB windows to bound per-connection zlib memory
+_AZURE_DEFLATE = ClientPerMessageDeflateFactory(
+    server_max_window_bits=12,
+    client_max_window_bits=12,
+    compress_settings={"memLevel": 5},
+)
+# Connect options for the Azure leg, shared by both header-style connect attempts
+_AZURE_CONNECT_OPTIONS = dict(
+    compression=None,
+    extensions=[_AZURE_DEFLATE],
+    max_size=2**23,
+    open_timeout=15,
+    close_timeout=5,
+)
+
+# Markers the model appends to its replies (see system_prompt), matched in one pass
+_MARKER_PREFIX = "##"
+_MARKER_RE = re.compile(
+    r'##(?:FORM:(?P<form>\w+)|FORM_VALUE:(?P<value>[^#]+)|(?P<question>QUESTION_ANSWERED))##',
+    re.IGNORECASE,
+)
+
+# Form marker name -> static form page served under /forms
+_FORM_URLS = {
+    "aadhaar": "/forms/formAadhaar.html",
+    "aadhar": "/forms/formAadhaar.html",
+    "income": "/forms/formIncome.html",
+    "mudra": "/forms/formIncome.html",
+}
+
+# Constant replies to the frontend, serialized once.
+_PONG_FRAME = orjson.dumps({"type": "pong"}).decode()
+# Pings as clients serialize them (JSON.stringify / orjson), answered without parsing
+_PING_FRAMES = frozenset({'{"type":"ping"}', b'{"type":"ping"}'})
+_PING_FRAME_LEN = len('{"type":"ping"}')
+_ERR_INVALID_JSON = orjson.dumps({"type": "error", "error": "invalid_json"}).decode()
+_ERR_TOO_LARGE = orjson.dumps({"type": "error", "error": "too_large"}).decode()
+_ERR_EMPTY_MESSAGE = orjson.dumps({"type": "error", "error": "empty_message"}).decode()
+_ERR_UNKNOWN_EVENT = orjson.dumps({"type": "error", "error": "unknown_event"}).decode()
+
+
 class AzureRealtimeBridge:
     """Manage a single Azure Realtime websocket connection and simple send helpers."""
 
+    # One bridge per connected client; fixed slots keep instances small and catch typos
+    __slots__ = (
+        "settings", "user_id", "ws", "_recv_task",
+        "_outbound", "_writer_task",
+        "_response_buffer", "_delta_buffer", "_delta_flush_task",
+        "_frontend_websocket", "_frontend_queue", "_frontend_writer",
+        "_closing", "_last_request_started", "_current_response_id", "_response_sent", "_system_sent",
+        "_form_session_active", "_awaiting_field_answer", "_ai_responding",
+        "_pending_requests", "_dropped_requests", "_message_seq",
+    )
+
     def __init__(self, settings: Settings, user_id: str):
         self.settings = settings
         self.user_id = user_id
         self.ws: Optional[websockets.WebSocketClientProtocol] = None  # type: ignore
-        self._lock = asyncio.Lock()
         self._recv_task: Optional[asyncio.Task] = None
-        self._response_buffer: list[str] = []
+        # Single writer task owns the Azure socket, so producers never contend on a lock
+        self._outbound: asyncio.Queue[str] = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._response_buffer = io.StringIO()
+        self._delta_buffer: list[str] = []
+        self._delta_flush_task: Optional[asyncio.Task] = None
         self._frontend_websocket: Optional[WebSocket] = None
+        self._frontend_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=FRONTEND_QUEUE_SIZE)
+        self._frontend_writer: Optional[asyncio.Task] = None
         self._closing = False
         self._last_request_started: Optional[float] = None
         self._current_response_id: Optional[str] = None
@@ -186,7 +302,9 @@ class AzureRealtimeBridge:
         self._form_session_active = False
         self._awaiting_field_answer = False
         self._ai_responding = False
-        self._pending_requests = []
+        self._pending_requests: deque[dict] = deque(maxlen=MAX_PENDING_REQUESTS)
+        self._dropped_requests = 0
+        self._message_seq = 0  # per-connection counter for ack message ids
 
         logger.info("AzureRealtimeBridge initialized (deployment=%s, api_version=%s, user_id=%s)",
                    self.settings.azure_openai_deployment_name, self.settings.openai_api_version, user_id)
@@ -230,9 +348,7 @@ class AzureRealtimeBridge:
             self.ws = await websockets.connect(
                 url,
                 additional_headers=headers,
-                max_size=2**23,
-                open_timeout=15,
-                close_timeout=5,
+                **_AZURE_CONNECT_OPTIONS,
             )
         except TypeError as te:
             logger.warning("[azure] additional_headers failed (%s), trying extra_headers", te)
@@ -240,34 +356,17 @@ class AzureRealtimeBridge:
             self.ws = await websockets.connect(
                 url,
                 extra_headers=headers_dict,
-                max_size=2**23,
-                open_timeout=15,
-                close_timeout=5,
+                **_AZURE_CONNECT_OPTIONS,
             )
 
         logger.info("[azure] Connected (%.2f ms)", (time.perf_counter() - connect_started) * 1000)
 
         # Configure session (minimal)
-        session_cfg = {
-            "type": "session.update",
-            "session": {
-                "modalities": ["text"],
-                "tool_choice": "none",
-            },
-        }
-        logger.info("[azure->] session.update: %s", json.dumps(session_cfg, ensure_ascii=False))
-        await self.ws.send(json.dumps(session_cfg))  # type: ignore
+        logger.info("[azure->] session.update: %s", _SESSION_UPDATE)
+        await self.ws.send(_SESSION_UPDATE)  # type: ignore
 
         # Send system instructions once
-        sys_msg = {
-            "type": "conversation.item.create",
-            "item": {
-                "role": "system",
-                "type": "message",
-                "content": [{"type": "input_text", "text": system_prompt}],
-            },
-        }
-        await self.ws.send(json.dumps(sys_msg))
+        await self.ws.send(_SYSTEM_PROMPT_ITEM)
         self._system_sent = True
         logger.info("[azure->] Sent system instructions once")
 
@@ -281,8 +380,8 @@ class AzureRealtimeBridge:
         try:
             async for raw in self.ws:  # type: ignore
                 try:
-                    event = json.loads(raw)
-                except Exception:
+                    event = orjson.loads(raw)
+                except orjson.JSONDecodeError:
                     logger.warning("[azure] Received non-JSON frame (ignored)")
                     continue
                 await self._handle_event(event)
@@ -293,49 +392,92 @@ class AzureRealtimeBridge:
     async def _handle_event(self, event: dict):
         etype = event.get("type")
         response_id = event.get("response_id")
-        logger.info("[azure<-event] type=%s keys=%s", etype, list(event.keys()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[azure<-event] type=%s keys=%s", etype, list(event.keys()))
 
         if response_id and response_id != self._current_response_id:
             self._current_response_id = response_id
             self._response_sent = False
+            # Text from a reply already delivered via output_item never reaches the
+            # buffered fallback; drop it so it cannot leak into this response
+            if self._response_buffer.tell():
+                self._response_buffer = io.StringIO()
             self._ai_responding = True
 
-        if etype == "response.output_text.delta":
-            delta = event.get("delta", "")
-            if delta:
-                self._response_buffer.append(delta)
-                await self._emit_frontend({"type": "assistant_delta", "delta": delta})
-
-        elif etype == "response.output_item.done" and not self._response_sent:
-            text = self._extract_text_from_output_item(event.get("item", {}))
-            if text:
-                message_id = event.get("item", {}).get("id")
-                await self._send_assistant_message(text, message_id, "output_item")
-
-        elif etype == "response.content_part.done" and not self._response_sent:
-            text = self._extract_text_from_content_part(event.get("part", {}))
-            if text:
-                await self._send_assistant_message(text, event_type="content_part_fallback")
-
-        elif etype in {"response.output_text.done", "response.completed", "response.done"} and not self._response_sent:
-            if self._response_buffer:
-                full = "".join(self._response_buffer)
-                self._response_buffer.clear()
-                await self._send_assistant_message(full, event_type="buffered_fallback")
-            
-            # Mark AI as no longer responding and process any pending requests
-            # Only do this if no message was sent (avoid double processing)
-            if not self._response_sent:
-                self._ai_responding = False
-                await self._process_pending_requests()
-
-        elif etype == "error":
-            err_msg = event.get("error", {}).get("message", "unknown_error")
-            logger.error("[azure] Error event: %s", err_msg)
-            await self._emit_frontend({"type": "error", "error": err_msg})
+        handler = self._EVENT_HANDLERS.get(etype)
+        if handler:
+            await handler(self, event)
         else:
             logger.debug("[azure] Ignored event type: %s", etype)
-        return
+
+    async def _on_text_delta(self, event: dict):
+        delta = event.get("delta", "")
+        if delta:
+            self._response_buffer.write(delta)
+            self._delta_buffer.append(delta)
+            if self._delta_flush_task is None:
+                self._delta_flush_task = asyncio.create_task(self._flush_deltas_later())
+
+    async def _on_output_item_done(self, event: dict):
+        if self._response_sent:
+            return
+        text = self._extract_text_from_output_item(event.get("item", {}))
+        if text:
+            message_id = event.get("item", {}).get("id")
+            await self._send_assistant_message(text, message_id, "output_item")
+
+    async def _on_content_part_done(self, event: dict):
+        if self._response_sent:
+            return
+        text = self._extract_text_from_content_part(event.get("part", {}))
+        if text:
+            await self._send_assistant_message(text, event_type="content_part_fallback")
+
+    async def _on_response_done(self, event: dict):
+        if self._response_sent:
+            return
+        await self._flush_deltas()
+        if self._response_buffer.tell():
+            full = self._response_buffer.getvalue()
+            self._response_buffer = io.StringIO()
+            await self._send_assistant_message(full, event_type="buffered_fallback")
+
+        # Mark AI as no longer responding and process any pending requests
+        # Only do this if no message was sent (avoid double processing)
+        if not self._response_sent:
+            self._ai_responding = False
+            await self._process_pending_requests()
+
+    async def _on_error(self, event: dict):
+        err_msg = event.get("error", {}).get("message", "unknown_error")
+        logger.error("[azure] Error event: %s", err_msg)
+        await self._emit_frontend({"type": "error", "error": err_msg})
+
+    # Azure realtime event type -> handler method; unlisted types are logged and ignored
+    _EVENT_HANDLERS = {
+        "response.output_text.delta": _on_text_delta,
+        "response.output_item.done": _on_output_item_done,
+        "response.content_part.done": _on_content_part_done,
+        "response.output_text.done": _on_response_done,
+        "response.completed": _on_response_done,
+        "response.done": _on_response_done,
+        "error": _on_error,
+    }
+
+    async def _flush_deltas_later(self):
+        await asyncio.sleep(DELTA_FLUSH_INTERVAL)
+        self._delta_flush_task = None
+        await self._flush_deltas()
+
+    async def _flush_deltas(self):
+        """Forward buffered deltas to the frontend as a single assistant_delta."""
+        if self._delta_flush_task is not None:
+            self._delta_flush_task.cancel()
+            self._delta_flush_task = None
+        if self._delta_buffer:
+            delta = "".join(self._delta_buffer)
+            self._delta_buffer.clear()
+            await self._emit_frontend({"type": "assistant_delta", "delta": delta})
 
     def _calculate_response_duration(self) -> Optional[float]:
         if self._last_request_started is not None:
@@ -343,59 +485,55 @@ class AzureRealtimeBridge:
         return None
 
     def _extract_text_from_output_item(self, item: dict) -> Optional[str]:
-        if item.get("type") == "message" and item.get("role") == "assistant":
-            content_list = item.get("content", [])
-            for content_item in content_list:
-                if content_item.get("type") == "text":
-                    return content_item.get("text", "") or None
-        return None
+        if item.get("type") != "message" or item.get("role") != "assistant":
+            return None
+        # Only the first text part is used; an empty one yields None
+        part = next((c for c in item.get("content", ()) if c.get("type") == "text"), None)
+        return (part.get("text") or None) if part else None
 
     def _extract_text_from_content_part(self, part: dict) -> Optional[str]:
         if part.get("type") == "text":
             return part.get("text", "") or None
         return None
 
-    def _extract_form_from_text(self, text: str) -> tuple[str, Optional[str]]:
-        import re
-        form_pattern = r'##FORM:(\w+)##'
-        match = re.search(form_pattern, text, re.IGNORECASE)
-        if match:
-            form_name = match.group(1).lower()
-            clean_text = re.sub(form_pattern, '', text, flags=re.IGNORECASE).strip()
-            return clean_text, form_name
-        return text, None
-
-    def _extract_form_value_from_text(self, text: str) -> tuple[str, Optional[str]]:
-        import re
-        form_value_pattern = r'##FORM_VALUE:([^#]+)##'
-        match = re.search(form_value_pattern, text, re.IGNORECASE)
-        if match:
-            form_value = match.group(1).strip()
-            clean_text = re.sub(form_value_pattern, '', text, flags=re.IGNORECASE).strip()
-            return clean_text, form_value
-        return text, None
-
-    def _extract_question_answered_from_text(self, text: str) -> tuple[str, bool]:
-        import re
-        question_answered_pattern = r'##QUESTION_ANSWERED##'
-        match = re.search(question_answered_pattern, text, re.IGNORECASE)
-        if match:
-            clean_text = re.sub(question_answered_pattern, '', text, flags=re.IGNORECASE).strip()
-            return clean_text, True
-        return text, False
-
+    def _extract_markers(self, text: str) -> tuple[str, Optional[str], Optional[str], bool]:
+        """Strip all response markers in a single scan.
+
+        Returns (clean_text, form_name, form_value, question_answered). When a marker
+        kind repeats, the first ##FORM and ##FORM_VALUE occurrences are used.
+        All markers are removed from clean_text.
+        """
+        # Most replies carry no marker; a substring scan is far cheaper than the regex
+        if _MARKER_PREFIX not in text:
+            return text, None, None, False
+
+        form_name: Optional[str] = None
+        form_value: Optional[str] = None
+        question_answered = False
+
+        def _take(match: re.Match) -> str:
+            nonlocal form_name, form_value, question_answered
+            if match.group("form") is not None:
+                if form_name is None:
+                    form_name = match.group("form").lower()
+            elif match.group("value") is not None:
+                if form_value is None:
+                    form_value = match.group("value").strip()
+            else:
+                question_answered = True
+            return ''
 
+        clean_text, count = _MARKER_RE.subn(_take, text)
+        if count:
+            clean_text = clean_text.strip()
+        return clean_text, form_name, form_value, question_answered
 
     def _get_form_url(self, form_name: str) -> str:
-        form_urls = {
-            "aadhaar": "/forms/formAadhaar.html",
-            "aadhar": "/forms/formAadhaar.html",
-            "income": "/forms/formIncome.html",
-            "mudra": "/forms/formIncome.html",
-        }
-        return form_urls.get(form_name, "")
+        return _FORM_URLS.get(form_name, "")
 
     async def _send_assistant_message(self, text: str, message_id: Optional[str] = None, event_type: str = ""):
+        # Deltas must reach the frontend before the consolidated message
+        await self._flush_deltas()
         duration_ms = self._calculate_response_duration()
         if duration_ms:
             logger.info("[azure] Response completed in %.2f ms, chars=%d (%s)",
@@ -403,19 +541,13 @@ class AzureRealtimeBridge:
         else:
             logger.info("[azure] Response completed chars=%d (%s)", len(text), event_type)
 
-        # Extract form activation marker
-        clean_text, form_name = self._extract_form_from_text(text)
-        
-        # Extract form value marker
-        clean_text, form_value = self._extract_form_value_from_text(clean_text)
-        
-        # Extract question answered marker
-        clean_text, question_answered = self._extract_question_answered_from_text(clean_text)
+        # Extract form activation, form value and question answered markers
+        clean_text, form_name, form_value, question_answered = self._extract_markers(text)
         
         message_payload = {
             "type": "assistant_message",
             "message": {
-                "id": message_id or str(uuid.uuid4()),
+                "id": message_id or uuid.uuid4().hex,
                 "role": "assistant",
                 "content": clean_text,
                 "type": "text",
@@ -441,19 +573,16 @@ class AzureRealtimeBridge:
 
         # Handle question answered marker (AI answered a user question during form filling)
         if question_answered and self._form_session_active:
-            logger.info(f"[DEBUG] AI answered a user question, keeping form session active")
+            logger.debug("AI answered a user question, keeping form session active")
             # Keep awaiting field answer since this was just answering a question
             self._awaiting_field_answer = True
 
         # Handle form value submission
         if form_value and self._form_session_active:
-            logger.info(f"[DEBUG] AI provided form value: '{form_value}'")
+            logger.debug("AI provided form value: %r", form_value)
             # Process the form value as if it was a user input
             success = await self._process_field_answer(form_value)
-            if success:
-                logger.info(f"[DEBUG] AI form value processed successfully")
-            else:
-                logger.info(f"[DEBUG] AI form value processing failed")
+            logger.debug("AI form value processed: %s", success)
 
         await self._emit_frontend(message_payload)
         self._response_sent = True
@@ -463,18 +592,75 @@ class AzureRealtimeBridge:
         await self._process_pending_requests()
 
     async def _emit_frontend(self, payload: dict):
-        ws = self._frontend_websocket
-        if ws:
+        if not self._frontend_websocket:
+            return
+        try:
+            frame = orjson.dumps(payload).decode()
+        except TypeError:
+            # orjson rejects e.g. ints beyond 64 bits, which a number-field answer can produce
+            logger.exception("Failed serializing %s payload for frontend", payload.get("type"))
+            return
+        await self.send_frontend(frame)
+
+    async def send_frontend(self, frame: str):
+        """Queue a serialized frame for the frontend writer task (all outbound frames go through here)."""
+        try:
+            self._frontend_queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            logger.warning("[client %s] Frontend send buffer full, closing slow consumer", self.user_id)
+            await self._close_frontend()
+            return
+        if self._frontend_writer is None:
+            self._frontend_writer = asyncio.create_task(self._frontend_writer_loop())
+
+    async def _frontend_writer_loop(self):
+        """Sole sender on the frontend websocket; gives up on clients that stop reading."""
+        while True:
+            frame = await self._frontend_queue.get()
+            ws = self._frontend_websocket
+            if not ws:
+                continue
             try:
-                await ws.send_text(json.dumps(payload))
+                await asyncio.wait_for(ws.send_text(frame), timeout=FRONTEND_SEND_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("[client %s] Frontend send timed out, closing slow consumer", self.user_id)
+                self._frontend_writer = None
+                await self._close_frontend()
+                return
             except Exception:
                 logger.exception("Failed sending payload to frontend")
+
+    async def _close_frontend(self):
+        """Disconnect the frontend (1013 try again later) and stop forwarding to it."""
+        ws, self._frontend_websocket = self._frontend_websocket, None
+        if self._frontend_writer:
+            self._frontend_writer.cancel()
+            self._frontend_writer = None
+        if ws:
+            try:
+                await ws.close(code=1013)
+            except Exception:
+                logger.debug("Frontend websocket already closed", exc_info=True)
     
+    def next_message_id(self) -> str:
+        """Return an ack id unique within this connection."""
+        self._message_seq += 1
+        return f"{self.user_id}:{self._message_seq}"
+
+    def _queue_pending(self, request: dict):
+        """Queue a request until the AI finishes responding, dropping the oldest when full."""
+        if len(self._pending_requests) == self._pending_requests.maxlen:
+            self._dropped_requests += 1
+            if self._dropped_requests % 32 == 1:
+                logger.warning("[azure] Pending request queue full for user %s, dropped %d so far",
+                               self.user_id, self._dropped_requests)
+        self._pending_requests.append(request)
+
     async def _process_pending_requests(self):
         """Process any pending requests that were queued while AI was responding."""
         if self._pending_requests and not self._ai_responding:
-            request = self._pending_requests.pop(0)
-            logger.info(f"[azure] Processing pending request: {request['type']}")
+            request = self._pending_requests.popleft()
+            logger.info("[azure] Processing pending request: %s", request['type'])
             
             if request['type'] == 'field_request':
                 await self._ask_for_next_field()
@@ -486,63 +672,62 @@ class AzureRealtimeBridge:
             elif request['type'] == 'system_message':
                 await self.send_system_message(request['content'])
 
-    async def _delayed_field_request(self):
-        """Delay the field request to allow form activation response to complete first."""
-        await asyncio.sleep(0.5)  # Small delay to ensure form is opened
-        await self._ask_for_next_field()
-    
+    def _build_focus_payload(self, session: FormSession, field: FormField) -> dict:
+        """form_field_focus event highlighting ``field`` with the session's progress."""
+        return {
+            "type": "form_field_focus",
+            "field_focus": {
+                "field_id": field.id
+            },
+            "form_progress": {
+                "current_index": session.current_field_index,
+                "total_fields": len(session.fields),
+                "percentage": session.progress_percentage,
+                "is_complete": session.is_complete
+            }
+        }
+
     async def _ask_for_next_field(self):
         """Ask the AI to request the next field from the user."""
         # If AI is currently responding, queue the field request
         if self._ai_responding:
-            logger.info(f"[azure] Queuing field request (AI busy)")
-            self._pending_requests.append({'type': 'field_request'})
+            logger.info("[azure] Queuing field request (AI busy)")
+            self._queue_pending({'type': 'field_request'})
             return
             
         session = form_field_manager.get_active_session(self.user_id)
         if not session:
-            logger.info(f"[DEBUG] No active session for user {self.user_id}")
+            logger.debug("No active session for user %s", self.user_id)
             return
         if not session.current_field:
-            logger.info(f"[DEBUG] No current field for user {self.user_id}, session complete: {session.is_complete}")
+            logger.debug("No current field for user %s, session complete: %s", self.user_id, session.is_complete)
             return
         
         field = session.current_field
-        logger.info(f"[DEBUG] Asking for field: {field.id} ({field.label}) for user {self.user_id}")
+        logger.debug("Asking for field: %s (%s) for user %s", field.id, field.label, self.user_id)
         
         # Send field focus event to frontend to highlight the next field
-        await self._emit_frontend({
-            "type": "form_field_focus",
-            "field_focus": {
-                "field_id": field.id
-            },
-            "form_progress": {
-                "current_index": session.current_field_index,
-                "total_fields": len(session.fields),
-                "percentage": session.progress_percentage,
-                "is_complete": session.is_complete
-            }
-        })
-        logger.info(f"[DEBUG] Sent form_field_focus to prepare field {field.id}")
+        await self._emit_frontend(self._build_focus_payload(session, field))
+        logger.debug("Sent form_field_focus to prepare field %s", field.id)
         
         # Create a natural prompt for the AI to ask for the field
         field_prompt = session.get_next_field_prompt()
         
         if field_prompt:
             # Send the field request directly to the user via the AI
-            logger.info(f"[DEBUG] Sending field prompt: {field_prompt}")
+            logger.debug("Sending field prompt: %s", field_prompt)
             await self.send_system_message(f"Ask the user: {field_prompt}")
             self._awaiting_field_answer = True
 
     async def _ask_for_next_field_with_acknowledgment(self, completed_value: str, completed_field_label: str):
         """Acknowledge the completed field and ask for the next field in a single message."""
-        logger.info(f"[DEBUG] Asking for next field with acknowledgment: '{completed_value}' for '{completed_field_label}'")
-        logger.info(f"[DEBUG] AI responding: {self._ai_responding}")
+        logger.debug("Asking for next field with acknowledgment: %r for %r (AI responding: %s)",
+                     completed_value, completed_field_label, self._ai_responding)
         
         # If AI is currently responding, queue the combined request
         if self._ai_responding:
-            logger.info(f"[azure] Queuing field request with acknowledgment (AI busy)")
-            self._pending_requests.append({
+            logger.info("[azure] Queuing field request with acknowledgment (AI busy)")
+            self._queue_pending({
                 'type': 'field_request_with_ack', 
                 'completed_value': completed_value,
                 'completed_field_label': completed_field_label
@@ -551,29 +736,18 @@ class AzureRealtimeBridge:
             
         session = form_field_manager.get_active_session(self.user_id)
         if not session:
-            logger.info(f"[DEBUG] No active session for user {self.user_id}")
+            logger.debug("No active session for user %s", self.user_id)
             return
         if not session.current_field:
-            logger.info(f"[DEBUG] No current field for user {self.user_id}, session complete: {session.is_complete}")
+            logger.debug("No current field for user %s, session complete: %s", self.user_id, session.is_complete)
             return
         
         field = session.current_field
-        logger.info(f"[DEBUG] Asking for field with acknowledgment: {field.id} ({field.label}) for user {self.user_id}")
+        logger.debug("Asking for field with acknowledgment: %s (%s) for user %s", field.id, field.label, self.user_id)
         
         # Send field focus event to frontend to highlight the next field
-        await self._emit_frontend({
-            "type": "form_field_focus",
-            "field_focus": {
-                "field_id": field.id
-            },
-            "form_progress": {
-                "current_index": session.current_field_index,
-                "total_fields": len(session.fields),
-                "percentage": session.progress_percentage,
-                "is_complete": session.is_complete
-            }
-        })
-        logger.info(f"[DEBUG] Sent form_field_focus to prepare field {field.id}")
+        await self._emit_frontend(self._build_focus_payload(session, field))
+        logger.debug("Sent form_field_focus to prepare field %s", field.id)
         
         # Create a natural prompt for the AI to ask for the field
         field_prompt = session.get_next_field_prompt()
@@ -581,32 +755,36 @@ class AzureRealtimeBridge:
         if field_prompt:
             # Combine acknowledgment with next field request
             combined_message = f"The user provided '{completed_value}' for {completed_field_label}. Acknowledge this briefly and positively, then ask the user: {field_prompt}"
-            logger.info(f"[DEBUG] Sending combined prompt: {combined_message}")
+            logger.debug("Sending combined prompt: %s", combined_message)
             await self.send_system_message(combined_message)
             self._awaiting_field_answer = True
     
     async def _process_field_answer(self, user_answer: str):
         """Process user's answer to a form field."""
-        logger.info(f"[DEBUG] Processing field answer: '{user_answer}' for user {self.user_id}")
-        logger.info(f"[DEBUG] Form session active: {self._form_session_active}, Awaiting answer: {self._awaiting_field_answer}")
+        logger.debug("Processing field answer: %r for user %s", user_answer, self.user_id)
+        logger.debug("Form session active: %s, Awaiting answer: %s",
+                     self._form_session_active, self._awaiting_field_answer)
         
         if not self._form_session_active:
-            logger.info(f"[DEBUG] No active form session, returning False")
+            logger.debug("No active form session, returning False")
             return False
         
         session = form_field_manager.get_active_session(self.user_id)
         if not session:
-            logger.info(f"[DEBUG] No session found for user {self.user_id}")
+            logger.debug("No session found for user %s", self.user_id)
             return False
         
-        logger.info(f"[DEBUG] Current field: {session.current_field.id if session.current_field else 'None'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current field: %s", session.current_field.id if session.current_field else None)
         
         # Process the answer
         result = form_field_manager.process_user_answer(self.user_id, user_answer)
-        logger.info(f"[DEBUG] Process result: {result['success']}, field: {result.get('completed_field', {}).get('id', 'None')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Process result: %s, field: %s",
+                         result["success"], result.get("completed_field", {}).get("id"))
         
         if result["success"]:
-            logger.info(f"[DEBUG] Field processed successfully, sending update to frontend")
+            logger.debug("Field processed successfully, sending update to frontend")
             # Send field update to frontend
             await self._emit_frontend({
                 "type": "form_field_update",
@@ -616,7 +794,7 @@ class AzureRealtimeBridge:
                 },
                 "form_progress": result["form_progress"]
             })
-            logger.info(f"[DEBUG] Sent form_field_update for field {result['completed_field']['id']}")
+            logger.debug("Sent form_field_update for field %s", result["completed_field"]["id"])
             
             # Check if form is complete
             if result["form_progress"]["is_complete"]:
@@ -646,8 +824,8 @@ class AzureRealtimeBridge:
             })
             
             # Ask AI to intelligently handle the validation error
-            session = form_field_manager.get_active_session(self.user_id)
-            if session and session.current_field:
+            # (a failed answer leaves the session looked up above on the same field)
+            if session.current_field:
                 field_prompt = session.get_next_field_prompt()
                 error_msg = result['error']
                 field_info = result.get('field', {})
@@ -666,100 +844,95 @@ class AzureRealtimeBridge:
         """Send a system message to the AI for internal communication."""
         # If AI is currently responding, queue the request
         if self._ai_responding:
-            logger.info(f"[azure] Queuing system message (AI busy): {content[:50]}...")
-            self._pending_requests.append({'type': 'system_message', 'content': content})
+            logger.info("[azure] Queuing system message (AI busy): %.50s...", content)
+            self._queue_pending({'type': 'system_message', 'content': content})
             return
             
-        async with self._lock:
-            await self.ensure_connected()
-            if not self.ws:
-                raise RuntimeError("Azure realtime websocket missing after connect")
-            
-            logger.info(f"[azure] Sending system message: {content[:50]}...")
-            
-            # Create system message
-            create_item = {
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "message",
-                    "role": "system",
-                    "content": [{"type": "input_text", "text": content}],
-                },
-            }
-            await self.ws.send(json.dumps(create_item))  # type: ignore
-            
-            # Request a response
-            response_req = {
-                "type": "response.create",
-                "response": {
-                    "modalities": ["text"],
-                    "conversation": "auto",
-                },
-            }
-            await self.ws.send(json.dumps(response_req))  # type: ignore
-            self._ai_responding = True
+        logger.info("[azure] Sending system message: %.50s...", content)
+        self._enqueue(_conversation_item("system", content), _RESPONSE_CREATE)
+        self._ai_responding = True
 
     async def send_user_message(self, content: str):
-        logger.info(f"[DEBUG] send_user_message called with: '{content}'")
-        logger.info(f"[DEBUG] _awaiting_field_answer: {self._awaiting_field_answer}, _form_session_active: {self._form_session_active}")
-        
-        # Check if we're waiting for a form field answer
-        if self._awaiting_field_answer and self._form_session_active:
-            logger.info(f"[DEBUG] User response during form filling - letting AI determine if question or answer")
-            # Always send to AI - it will intelligently determine if this is:
-            # 1. A question (will respond with ##QUESTION_ANSWERED## marker)
-            # 2. An answer (will respond with ##FORM_VALUE:## marker)
-            # This removes language-specific heuristics and supports all languages/modalities
-        else:
-            logger.info(f"[DEBUG] Not in form filling mode, sending to AI")
+        # During form filling we still always send to AI - it will intelligently determine if this is:
+        # 1. A question (will respond with ##QUESTION_ANSWERED## marker)
+        # 2. An answer (will respond with ##FORM_VALUE:## marker)
+        # This removes language-specific heuristics and supports all languages/modalities
+        logger.debug("send_user_message content=%r awaiting_field=%s form_active=%s",
+                     content, self._awaiting_field_answer, self._form_session_active)
         
         # Don't send new messages while AI is responding
         if self._ai_responding:
-            logger.warning(f"[azure] Ignoring user message while AI is responding: {content[:50]}...")
+            logger.warning("[azure] Ignoring user message while AI is responding: %.50s...", content)
             return
         
-        async with self._lock:
-            await self.ensure_connected()
-            if not self.ws:
-                raise RuntimeError("Azure realtime websocket missing after connect")
-            self._last_request_started = time.perf_counter()
-
-            # 1. Create conversation item (user message)
-            create_item = {
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "message",
-                    "role": "user",
-                    "content": [{"type": "input_text", "text": content}],
-                },
-            }
-            await self.ws.send(json.dumps(create_item))  # type: ignore
-
-            # 2. Request a response (no need to repeat system prompt)
-            response_req = {
-                "type": "response.create",
-                "response": {
-                    "modalities": ["text"],
-                    "conversation": "auto",
-                },
-            }
-            await self.ws.send(json.dumps(response_req))  # type: ignore
-            self._ai_responding = True
+        self._last_request_started = time.perf_counter()
+        # 1. Create conversation item (user message)
+        # 2. Request a response (no need to repeat system prompt)
+        self._enqueue(_conversation_item("user", content), _RESPONSE_CREATE)
+        self._ai_responding = True
+
+    def _enqueue(self, *frames: str):
+        """Queue serialized events for the Azure writer task, starting it on demand."""
+        for frame in frames:
+            self._outbound.put_nowait(frame)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self):
+        """Sole sender on the Azure websocket; connects lazily before sending."""
+        while True:
+            frames = [await self._outbound.get()]
+            # Turns are queued as item + response.create; flush everything already
+            # queued in one wake-up with a single connection check.
+            while not self._outbound.empty():
+                frames.append(self._outbound.get_nowait())
+            for attempt in (1, 2):
+                try:
+                    await self.ensure_connected()
+                    if not self.ws:
+                        raise RuntimeError("Azure realtime websocket missing after connect")
+                    for frame in frames:
+                        await self.ws.send(frame)  # type: ignore
+                    break
+                except websockets.exceptions.ConnectionClosed as e:
+                    # Azure dropped an idle session; reconnect once and resend the whole batch
+                    if attempt == 1 and not self._closing:
+                        logger.warning("[azure] Connection closed while sending (%s), reconnecting", e)
+                        continue
+                    await self._fail_queued_turn(e)
+                    break
+                except Exception as e:
+                    await self._fail_queued_turn(e)
+                    break
+
+    async def _fail_queued_turn(self, error: Exception):
+        logger.exception("[azure] Failed sending queued event", exc_info=error)
+        # Drop the rest of the failed turn; no response will arrive for it
+        while not self._outbound.empty():
+            self._outbound.get_nowait()
+        self._ai_responding = False
+        await self._emit_frontend({"type": "error", "error": str(error)})
 
     async def close(self):
+        """Cancel background tasks and close the Azure socket, all within BRIDGE_CLOSE_TIMEOUT."""
         self._closing = True
-        if self._recv_task:
-            self._recv_task.cancel()
-            try:
-                await self._recv_task
-            except Exception:
-                pass
+        pending = []
+        for task in (self._writer_task, self._recv_task, self._delta_flush_task, self._frontend_writer):
+            if task and not task.done():
+                task.cancel()
+                pending.append(task)
+        ws_close = None
         if self.ws:
-            try:
-                await self.ws.close()  # type: ignore
-            except Exception:
-                logger.exception("Error while closing azure websocket")
+            ws_close = asyncio.ensure_future(self.ws.close())  # type: ignore
+            pending.append(ws_close)
             self.ws = None
+        if not pending:
+            return
+        _, stuck = await asyncio.wait(pending, timeout=BRIDGE_CLOSE_TIMEOUT)
+        if stuck:
+            logger.warning("[client %s] %d task(s) still running after bridge close timeout", self.user_id, len(stuck))
+        elif ws_close and not ws_close.cancelled() and ws_close.exception():
+            logger.error("Error while closing azure websocket", exc_info=ws_close.exception())
 
 
 @router.post("/restart")
@@ -767,48 +940,84 @@ async def restart_all_sessions():
     """Clear all form sessions."""
     try:
         # Clear all active sessions
-        form_field_manager.active_sessions.clear()
-        logger.info("[restart] Cleared all sessions")
+        cleared = form_field_manager.clear_all_sessions()
+        logger.info("[restart] Cleared all sessions (%d)", cleared)
         return {"success": True, "message": "All sessions restarted successfully"}
     except Exception as e:
         logger.exception("[restart] Error clearing all sessions")
         return {"success": False, "error": str(e)}
 
 
+async def _handle_ping(ws: WebSocket, msg: dict, bridge: AzureRealtimeBridge, client_id: str):
+    await bridge.send_frontend(_PONG_FRAME)
+
+
+async def _handle_user_message(ws: WebSocket, msg: dict, bridge: AzureRealtimeBridge, client_id: str):
+    content = msg.get("content")
+    if not isinstance(content, str):
+        content = ""
+    # Only pay for a copy when there is surrounding whitespace to trim
+    if content and (content[0].isspace() or content[-1].isspace()):
+        content = content.strip()
+    if not content:
+        await bridge.send_frontend(_ERR_EMPTY_MESSAGE)
+        return
+    mid = bridge.next_message_id()
+    await bridge.send_frontend(orjson.dumps({"type": "ack", "message_id": mid}).decode())
+    try:
+        await bridge.send_user_message(content)
+    except Exception as e:
+        logger.exception("[client %s] Failed sending to Azure realtime", client_id)
+        await bridge.send_frontend(orjson.dumps({"type": "error", "error": str(e)}).decode())
+
+
+async def _handle_unknown(ws: WebSocket, msg: dict, bridge: AzureRealtimeBridge, client_id: str):
+    await bridge.send_frontend(_ERR_UNKNOWN_EVENT)
+
+
+# Client event type -> handler
+_HANDLERS: dict[str, Callable[[WebSocket, dict, AzureRealtimeBridge, str], Awaitable[None]]] = {
+    "ping": _handle_ping,
+    "user_message": _handle_user_message,
+}
+
+
+async def _iter_frames(ws: WebSocket) -> AsyncIterator[str | bytes]:
+    """Yield raw client frames, text or binary, until the client disconnects."""
+    while True:
+        message = await ws.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        # orjson parses bytes or str directly, so take the frame as delivered
+        yield message.get("bytes") or message.get("text") or ""
+
+
 @router.websocket("/ws")
 async def chat_ws(ws: WebSocket, settings: Settings = Depends(get_settings)):
     await ws.accept()
-    client_id = str(uuid.uuid4())
+    client_id = uuid.uuid4().hex
     bridge = AzureRealtimeBridge(settings, client_id)
     bridge._frontend_websocket = ws
     logger.info("[client %s] Connected", client_id)
     try:
-        while True:
-            raw = await ws.receive_text()
-            try:
-                msg = json.loads(raw)
-            except Exception:
-                await ws.send_text(json.dumps({"type": "error", "error": "invalid_json"}))
+        async for raw in _iter_frames(ws):
+            # Length first so other frames are never hashed for the set lookup
+            if len(raw) == _PING_FRAME_LEN and raw in _PING_FRAMES:
+                await bridge.send_frontend(_PONG_FRAME)
                 continue
-            mtype = msg.get("type")
-            if mtype == "ping":
-                await ws.send_text(json.dumps({"type": "pong"}))
+            if len(raw) > MAX_WS_FRAME:
+                await bridge.send_frontend(_ERR_TOO_LARGE)
                 continue
-            if mtype == "user_message":
-                content = (msg.get("content") or "").strip()
-                if not content:
-                    await ws.send_text(json.dumps({"type": "error", "error": "empty_message"}))
-                    continue
-                mid = str(uuid.uuid4())
-                await ws.send_text(json.dumps({"type": "ack", "message_id": mid}))
-                try:
-                    await bridge.send_user_message(content)
-                except Exception as e:
-                    logger.exception("[client %s] Failed sending to Azure realtime", client_id)
-                    await ws.send_text(json.dumps({"type": "error", "error": str(e)}))
-            else:
-                await ws.send_text(json.dumps({"type": "error", "error": "unknown_event"}))
-    except WebSocketDisconnect:
+            try:
+                msg = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                await bridge.send_frontend(_ERR_INVALID_JSON)
+                continue
+            # Valid JSON that is not an event object (array, number, ...) or whose type is
+            # not a string (possibly unhashable) is an unknown event
+            mtype = msg.get("type") if isinstance(msg, dict) else None
+            handler = _HANDLERS.get(mtype, _handle_unknown) if isinstance(mtype, str) else _handle_unknown
+            await handler(ws, msg, bridge, client_id)
         logger.info("[client %s] Disconnected", client_id)
     except Exception as e:
         logger.exception("[client %s] Websocket error: %s", client_id, e)
@@ -0,0 +1,14 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+
+@pytest.fixture
+def backend_cwd(monkeypatch):
+    """Run from backend/, where form_field_manager looks for form_schemas/."""
+    monkeypatch.chdir(BACKEND_DIR)
+    return BACKEND_DIR
@@ -0,0 +1,59 @@
+"""Regression tests for AzureRealtimeBridge's frontend path."""
+
+import asyncio
+
+import orjson
+import pytest
+
+from app.config import Settings
+from app.form_manager import form_field_manager
+from app.routers.chat import AzureRealtimeBridge
+
+USER_ID = "test-user"
+
+
+class FakeFrontend:
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, frame):
+        self.frames.append(orjson.loads(frame))
+
+    async def close(self, code=1000):
+        pass
+
+
+@pytest.fixture
+def bridge(backend_cwd):
+    b = AzureRealtimeBridge(Settings(), USER_ID)
+    b._frontend_websocket = FakeFrontend()
+    yield b
+    form_field_manager.clear_session(USER_ID)
+
+
+def test_emit_frontend_skips_unserializable_payload(bridge):
+    async def run():
+        await bridge._emit_frontend({"type": "form_field_update", "value": 10**20})
+        await bridge._emit_frontend({"type": "pong"})
+        await asyncio.sleep(0)
+        await bridge.close()
+
+    asyncio.run(run())
+    assert bridge._frontend_websocket.frames == [{"type": "pong"}]
+
+
+def test_oversized_number_answer_does_not_raise(bridge):
+    async def run():
+        session = form_field_manager.create_form_session(USER_ID, "aadhaar")
+        session.current_field_index = next(i for i, f in enumerate(session.fields) if f.type == "number")
+        bridge._form_session_active = True
+        # AI busy: the next-field prompt is queued rather than sent to Azure
+        bridge._ai_responding = True
+
+        assert await bridge._process_field_answer("99999999999999999999") is True
+        await bridge.close()
+        return session
+
+    session = asyncio.run(run())
+    assert 99999999999999999999 in session.completed_fields.values()
+    assert [r["type"] for r in bridge._pending_requests] == ["field_request"]